@@ -0,0 +1,39 @@
+# _kernels.py
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+"""Compiled kernels for operations on very large data sets. Requires the optional package numba; callers must check
+`NUMBA_ENABLED` and fall back to NumPy otherwise."""
+
+try:
+    from numba import njit, prange
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+
+# energy tables with more entries than this are processed by the compiled kernels (if available)
+KERNEL_MIN_SIZE = 10**6
+
+
+if NUMBA_ENABLED:
+    @njit(parallel=True, cache=True)
+    def subtract_ground(energy_table):
+        """Subtracts the ground state energy from each row of the 2d array `energy_table` (in place), distributing
+        the rows across threads.
+
+        Parameters
+        ----------
+        energy_table: ndarray
+            float64 array of shape (paramvals_count, evals_count)
+        """
+        for param_index in prange(energy_table.shape[0]):
+            ground_energy = energy_table[param_index, 0]
+            for level_index in range(energy_table.shape[1]):
+                energy_table[param_index, level_index] -= ground_energy
@@ -47,6 +47,7 @@ class Explorer:
         self.sweep = sweep
         self.evals_count = evals_count
         self.figsize = figsize
+        self._fig_axs = None
 
         swp.generate_chi_sweep(sweep)
         swp.generate_charge_matrixelem_sweep(sweep)
@@ -54,6 +55,8 @@ class Explorer:
     def plot_explorer_panels(self, param_val, photonnumber, initial_index, final_index, qbt_index, osc_index):
         """
         Create a panel of plots (bare spectra, bare wavefunctions, dressed spectrum, n-photon qubit transitions, chi).
+        The figure is created upon the first call and reused subsequently; panels whose content does not change
+        only have their markers for the current parameter value updated.
 
         Parameters
         ----------
@@ -87,30 +90,40 @@ class Explorer:
         energy_final = self.sweep.lookup.energy_dressed_index(final_index, param_index) - energy_ground
         qbt_subsys = self.sweep.hilbertspace[qbt_index]
 
-        nrows = 3
-        ncols = 2
-        fig, axs = plt.subplots(ncols=ncols, nrows=nrows, figsize=self.figsize)
+        if self._fig_axs is None:
+            nrows = 3
+            ncols = 2
+            self._fig_axs = plt.subplots(ncols=ncols, nrows=nrows, figsize=self.figsize)
+        fig, axs = self._fig_axs
         axes_list_flattened = [elem for sublist in axs for elem in sublist]
 
-        # Panel 1 ----------------------------------
-        panels.display_bare_spectrum(self.sweep, qbt_subsys, param_val, fig_ax(0))
+        with panels.ExplorerPanelBatch():
+            # Panel 1 ----------------------------------
+            panels.display_bare_spectrum(self.sweep, qbt_subsys, param_val, fig_ax(0))
 
-        # Panels 2 and 6----------------------------
-        if type(qbt_subsys).__name__ in ['Transmon', 'Fluxonium']:   # do not plot wavefunctions if multi-dimensional
-            panels.display_bare_wavefunctions(self.sweep, qbt_subsys, param_val, fig_ax(1))
-            panels.display_charge_matrixelems(self.sweep, initial_bare, qbt_subsys, param_val, fig_ax(5))
+            # Panels 2 and 6----------------------------
+            if type(qbt_subsys).__name__ in ['Transmon', 'Fluxonium']:   # no wavefunctions if multi-dimensional
+                panels.display_bare_wavefunctions(self.sweep, qbt_subsys, param_val, fig_ax(1))
+                panels.display_charge_matrixelems(self.sweep, initial_bare, qbt_subsys, param_val, fig_ax(5))
+            else:
+                panels.clear_panel(fig_ax(1))
+                panels.clear_panel(fig_ax(5))
 
-        # Panel 3 ----------------------------------
-        panels.display_dressed_spectrum(self.sweep, initial_bare, final_bare, energy_initial, energy_final, param_val,
-                                        fig_ax(2))
+            # Panel 3 ----------------------------------
+            panels.display_dressed_spectrum(self.sweep, initial_bare, final_bare, energy_initial, energy_final,
+                                            param_val, fig_ax(2))
 
-        # Panel 4 ----------------------------------
-        panels.display_n_photon_qubit_transitions(self.sweep, photonnumber, initial_bare, param_val, fig_ax(3))
+            # Panel 4 ----------------------------------
+            panels.display_n_photon_qubit_transitions(self.sweep, photonnumber, initial_bare, param_val, fig_ax(3))
 
-        # Panel 5 ----------------------------------
-        panels.display_chi_01(self.sweep, qbt_index, osc_index, param_index, fig_ax(4))
+            # Panel 5 ----------------------------------
+            panels.display_chi_01(self.sweep, qbt_index, osc_index, param_index, fig_ax(4))
 
-        fig.tight_layout()
+            fig.tight_layout()
+
+        if not plt.fignum_exists(fig.number):
+            # the figure was closed by the backend after previous display (e.g., inline backend), so show it again
+            display(fig)
         return fig, axs
 
     def interact(self):
@@ -47,6 +47,8 @@ class Fluxonium(QubitBaseClass1d):
     truncated_dim: int, optional
         desired dimension of the truncated quantum system
     """
+    # methods returning WaveFunction instances obtained via `WaveFunction.acquire`, see `_release_wavefunction`
+    _transient_wavefunction_methods = ('wavefunction',)
 
     def __init__(self, EJ, EC, EL, flux, cutoff, truncated_dim=None):
         self.EJ = EJ
@@ -201,4 +203,5 @@ class Fluxonium(QubitBaseClass1d):
         for n in range(dim):
             phi_wavefunc_amplitudes += wavefunc_osc_basis_amplitudes[n] * harm_osc_wavefunction(n, phi_basis_labels,
                                                                                                 phi_osc)
-        return WaveFunction(basis_labels=phi_basis_labels, amplitudes=phi_wavefunc_amplitudes, energy=evals[which])
+        return WaveFunction.acquire(basis_labels=phi_basis_labels, amplitudes=phi_wavefunc_amplitudes,
+                                    energy=evals[which])
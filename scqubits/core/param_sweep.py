@@ -49,16 +49,31 @@ class ParameterSweep:
         self.hilbertspace = hilbertspace
         self.subsys_update_list = subsys_update_list
         self.update_hilbertspace = update_hilbertspace
+        self._subsys_index_map = {id(subsys): index for index, subsys in enumerate(hilbertspace)}
 
         self.lookup = None
         self.bare_specdata_list = None
         self.dressed_specdata = None
         self._bare_hamiltonian_constant = None
+        self._panel_titles = {}
         self.sweep_data = {}
 
         # generate the spectral data sweep
         self.generate_parameter_sweep()
 
+    def get_subsys_index(self, subsys):
+        """Return the index of the given subsystem in the underlying HilbertSpace (constant-time lookup).
+
+        Parameters
+        ----------
+        subsys: QuantumSystem
+
+        Returns
+        -------
+        int
+        """
+        return self._subsys_index_map[id(subsys)]
+
     def generate_parameter_sweep(self):
         """Top-level method for generating all parameter sweep data"""
         self.bare_specdata_list = self._compute_bare_specdata_sweep()
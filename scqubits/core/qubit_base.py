@@ -395,6 +395,15 @@ class QubitBaseClass1d(QubitBaseClass):
     def wavefunction(self, esys, which=0, phi_grid=None):
         pass
 
+    def _release_wavefunction(self, wavefunc, method_name='wavefunction'):
+        """Returns `wavefunc`, obtained from the method `method_name` of self, to the WaveFunction pool. This is only
+        done if the class implementing the method lists it in its own `_transient_wavefunction_methods`, i.e., the
+        method returns transient instances obtained via `WaveFunction.acquire`. Wave functions from overriding
+        methods may be held elsewhere and are left untouched."""
+        method_owner = next(cls for cls in type(self).__mro__ if method_name in cls.__dict__)
+        if method_name in method_owner.__dict__.get('_transient_wavefunction_methods', ()):
+            wavefunc.release()
+
     def plot_wavefunction(self, which=0,  mode='real', esys=None, phi_grid=None, scaling=None, **kwargs):
         """Plot 1d phase-basis wave function(s). Must be overwritten by higher-dimensional qubits like FluxQubits and
         ZeroPi.
@@ -425,14 +434,18 @@ class QubitBaseClass1d(QubitBaseClass):
         index_list = process_which(which, self.truncated_dim)
         phi_wavefunc = self.wavefunction(esys, which=index_list[-1], phi_grid=phi_grid)
         potential_vals = self.potential(phi_wavefunc.basis_labels)
+        self._release_wavefunction(phi_wavefunc)
         scale = set_scaling(self, scaling, potential_vals)
 
         amplitude_modifier = constants.MODE_FUNC_DICT[mode]
         kwargs = {**defaults.wavefunction1d_discrete(mode), **kwargs}  # if any duplicates, later ones survive
         for wavefunc_index in index_list:
             phi_wavefunc = self.wavefunction(esys, which=wavefunc_index, phi_grid=phi_grid)
-            phi_wavefunc.amplitudes = standardize_sign(phi_wavefunc.amplitudes)
-            phi_wavefunc.amplitudes = amplitude_modifier(phi_wavefunc.amplitudes)
-            plot.wavefunction1d(phi_wavefunc, potential_vals=potential_vals, offset=phi_wavefunc.energy,
-                                scaling=scale, **kwargs)
+            try:
+                phi_wavefunc.amplitudes = standardize_sign(phi_wavefunc.amplitudes)
+                phi_wavefunc.amplitudes = amplitude_modifier(phi_wavefunc.amplitudes)
+                plot.wavefunction1d(phi_wavefunc, potential_vals=potential_vals, offset=phi_wavefunc.energy,
+                                    scaling=scale, **kwargs)
+            finally:
+                self._release_wavefunction(phi_wavefunc)
         return fig_ax
@@ -9,13 +9,27 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
+import h5py
+import numpy as np
+
+import scqubits.core._kernels as kernels
 import scqubits.settings as config
 import scqubits.utils.file_io as io
 import scqubits.utils.plotting as plot
 from scqubits.utils.misc import process_metadata, value_not_none, convert_to_ndarray
 
 
+# pool of released WaveFunction instances available for reuse, see `WaveFunction.acquire`
+_WAVEFN_POOL = []
+
+# arrays larger than this (in bytes) are copied to row-major layout by several threads, see `_relayout_row_major`
+PARALLEL_RELAYOUT_NBYTES = 2**26
+
+
 # —WaveFunction class———————————————————————————————————————————————————————————————————————————————————————————————————
 
 class WaveFunction:
@@ -31,11 +45,43 @@ class WaveFunction:
     energy: float, optional
         energy of the wave function
     """
+    __slots__ = ('basis_labels', 'amplitudes', 'energy')
+
     def __init__(self, basis_labels, amplitudes, energy=None):
         self.basis_labels = basis_labels
         self.amplitudes = amplitudes
         self.energy = energy
 
+    @classmethod
+    def acquire(cls, basis_labels, amplitudes, energy=None):
+        """Returns a WaveFunction holding the given data. A previously released instance is reused if available,
+        avoiding allocation of transient objects, e.g., during repeated plotting. Subclasses always obtain a new
+        instance.
+
+        Parameters
+        ----------
+        basis_labels: ndarray
+        amplitudes: ndarray
+        energy: float, optional
+
+        Returns
+        -------
+        WaveFunction
+        """
+        if cls is WaveFunction and _WAVEFN_POOL:
+            wavefunc = _WAVEFN_POOL.pop()
+            wavefunc.__init__(basis_labels, amplitudes, energy)
+            return wavefunc
+        return cls(basis_labels, amplitudes, energy)
+
+    def release(self):
+        """Returns the instance to the pool used by `acquire`. The instance must not be used after release. Only
+        transient instances obtained via `acquire` within scqubits may be released; in particular, wave functions
+        that may be cached or otherwise held elsewhere must not be released."""
+        self.basis_labels = self.amplitudes = self.energy = None
+        if type(self) is WaveFunction:
+            _WAVEFN_POOL.append(self)
+
 
 # —WaveFunctionOnGrid class—————————————————————————————————————————————————————————————————————————————————————————————
 
@@ -52,12 +98,61 @@ class WaveFunctionOnGrid:
     energy: float, optional
         energy corresponding to the wave function
     """
+    __slots__ = ('gridspec', 'amplitudes', 'energy')
+
     def __init__(self, gridspec, amplitudes, energy=None):
         self.gridspec = gridspec
         self.amplitudes = amplitudes
         self.energy = energy
 
 
+def _relayout_row_major(array):
+    """Returns a C-contiguous copy of `array`. Large arrays are copied in slabs along the leading axis by a pool of
+    threads (numpy releases the GIL during copying), which speeds up relayout of multi-GB data on multi-core machines.
+
+    Parameters
+    ----------
+    array: ndarray
+
+    Returns
+    -------
+    ndarray
+    """
+    worker_count = min(os.cpu_count() or 1, array.shape[0])
+    if array.nbytes < PARALLEL_RELAYOUT_NBYTES or worker_count < 2 or array.dtype.hasobject:
+        return np.ascontiguousarray(array)
+
+    def copy_slab(start, stop):
+        result[start:stop] = array[start:stop]
+
+    result = np.empty(array.shape, dtype=array.dtype)
+    bounds = np.linspace(0, array.shape[0], worker_count + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        list(executor.map(copy_slab, bounds[:-1], bounds[1:]))
+    return result
+
+
+def _as_row_major(data, param_count):
+    """Return ndarray data with a leading parameter axis in C-contiguous (row-major) layout, so that slices along the
+    parameter axis occupy contiguous memory. Other data, such as eigenvectors stored for constant parameters, are
+    returned unchanged.
+
+    Parameters
+    ----------
+    data: object
+    param_count: int or None
+        number of parameter values, i.e., expected length of the leading axis
+
+    Returns
+    -------
+    object
+    """
+    if (isinstance(data, np.ndarray) and data.ndim >= 2 and data.shape[0] == param_count
+            and not data.flags['C_CONTIGUOUS']):
+        return _relayout_row_major(data)
+    return data
+
+
 # —BaseData class———————————————————————————————————————————————————————————————————————————————————————————————————
 
 
@@ -80,20 +175,37 @@ class DataStore:
         self.param_name = param_name
         self.param_vals = param_vals
         self.system_params = system_params
-        self.data_names = kwargs.keys()
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self.data_names = tuple(kwargs)
+        param_count = None if param_vals is None else len(param_vals)
+        self._data_store = {key: _as_row_major(value, param_count) for key, value in kwargs.items()}
+        self.__dict__.update(self._data_store)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__dict__.get('_data_store', ()):
+            # replace rather than mutate the data dictionary, so that shallow copies of self remain independent
+            super().__setattr__('_data_store', {**self._data_store, name: value})
+
+    @property
+    def system_params(self):
+        return self._system_params
+
+    @system_params.setter
+    def system_params(self, system_params):
+        self._system_params = system_params
+        self._processed_system_meta = None
 
     def param_count(self):
         return len(self.param_vals)
 
     def _get_metadata_dict(self):
-        meta_dict = {'param_name': self.param_name, 'param_vals': self.param_vals}
-        meta_dict.update(process_metadata(self.system_params))
-        return meta_dict
+        if self._processed_system_meta is None:
+            # system_params are processed once and reused for all subsequent writes, until they are reassigned
+            self._processed_system_meta = process_metadata(self.system_params)
+        return {'param_name': self.param_name, 'param_vals': self.param_vals, **self._processed_system_meta}
 
     def _get_data_dict(self):
-        return {key: value for key, value in self.__dict__.items() if key in self.data_names}
+        return self._data_store
 
     def _serialize(self, writer):
         """
@@ -104,7 +216,11 @@ class DataStore:
         metadata_dict = self._get_metadata_dict()
         writer.create_meta(metadata_dict)
         for data_name, data in filter(value_not_none, self._get_data_dict().items()):
-            writer.add_dataset(data_name, convert_to_ndarray(data))
+            writer.add_dataset(data_name, self._data_as_ndarray(data_name, data))
+
+    def _data_as_ndarray(self, data_name, data):
+        """Converts the data set `data_name` to a numerical ndarray for writing to file"""
+        return convert_to_ndarray(data)
 
     def set_from_data(self, *data_from_file):
         """
@@ -119,8 +235,9 @@ class DataStore:
         self.param_name = metadata_dict.pop('param_name')
         self.param_vals = metadata_dict.pop('param_vals')
         self.system_params = metadata_dict
-        for index, attribute in enumerate(name_list):
-            setattr(self, attribute, data_list[index])
+        self._data_store = {**self._data_store, **dict(zip(name_list, data_list))}
+        self.data_names = tuple(self._data_store)
+        self.__dict__.update(self._data_store)
 
     @classmethod
     def _init_from_data(cls, *data_from_file):
@@ -143,16 +260,44 @@ class DataStore:
         data_dict = {name: data_list[i] for i, name in enumerate(name_list)}
         return cls(param_name=param_name, param_vals=param_vals, system_params=system_params, **data_dict)
 
-    def filewrite(self, filename):
+    @classmethod
+    def _fast_init_from_data(cls, *data_from_file):
+        """
+        Like `_init_from_data`, but bypasses `__init__` and populates the new object in bulk. Data sets are stored
+        as read, without checks or conversion; intended for bulk reloading of files written by scqubits.
+
+        Parameters
+        ----------
+        data_from_file: (dict, list(str), list(ndarray))
+            metadata dictionary, list of dataset names, list of datasets (ndarray)
+
+        Returns
+        -------
+        DataStore
+        """
+        metadata_dict, name_list, data_list = data_from_file
+        new_object = cls.__new__(cls)
+        new_object.param_name = metadata_dict.pop('param_name')
+        new_object.param_vals = metadata_dict.pop('param_vals')
+        new_object.system_params = metadata_dict
+        new_object._data_store = dict(zip(name_list, data_list))
+        new_object.data_names = tuple(new_object._data_store)
+        new_object.__dict__.update(new_object._data_store)
+        return new_object
+
+    def filewrite(self, filename, parallel=False):
         """Write metadata and spectral data to file
 
         Parameters
         ----------
         filename: str
+        parallel: bool, optional
+            if True, data sets are written in partitions along the parameter axis, one file per MPI rank, and
+            combined into a single virtual view in the main file (h5 only); default: False
         """
         file_format = config.FILE_FORMAT
         writer = io.ObjectWriter()
-        writer.filewrite(self, file_format, filename)
+        writer.filewrite(self, file_format, filename, parallel=parallel)
 
     def set_from_fileread(self, filename):
         """Read metadata and spectral data from file, and use those to set parameters of the SpectrumData object (self).
@@ -166,12 +311,16 @@ class DataStore:
         reader.set_params_from_file(self, file_format, filename)
 
     @classmethod
-    def create_from_file(cls, filename):
+    def create_from_file(cls, filename, mmap=False):
         """Read metadata and spectral data from file, and use those to create a new SpectrumData object.
 
         Parameters
         ----------
         filename: str
+        mmap: bool, optional
+            if True, data sets are not loaded into memory; instead, they are stored as read-only h5py.Dataset objects
+            that read the requested slices from file on demand (h5 only); the file remains open until `close` is
+            called, or the object is used as a context manager; default: False
 
         Returns
         -------
@@ -180,7 +329,39 @@ class DataStore:
         """
         file_format = config.FILE_FORMAT
         reader = io.ObjectReader()
-        return reader.create_from_file(cls, file_format, filename)
+        return reader.create_from_file(cls, file_format, filename, mmap=mmap)
+
+    def close(self):
+        """Closes the file backing data sets read via `create_from_file(..., mmap=True)`, after which these data sets
+        are no longer accessible. Has no effect for data held in memory."""
+        h5file = self.__dict__.pop('_h5file', None)
+        if h5file is not None:
+            h5file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def create_from_files(cls, filenames):
+        """Read metadata and data from several files, e.g., snapshots of repeated sweeps, and create one new object
+        per file. Objects are constructed via a fast path that skips the checks performed by `create_from_file`,
+        and should only be used for files written by scqubits.
+
+        Parameters
+        ----------
+        filenames: list(str)
+
+        Returns
+        -------
+        list
+            new objects of class `cls`, in the order of `filenames`
+        """
+        file_format = config.FILE_FORMAT
+        reader = io.ObjectReader()
+        return reader.create_from_files(cls, file_format, filenames)
 
 
 # —SpectrumData class———————————————————————————————————————————————————————————————————————————————————————————————————
@@ -198,7 +379,9 @@ class SpectrumData(DataStore):
     param_vals: ndarray
         parameter values for which spectrum data are stored
     energy_table: ndarray
-        energy eigenvalues stored for each `param_vals` point
+        energy eigenvalues stored for each `param_vals` point; axis 0 indexes the parameter value, axis 1 the level.
+        Stored as float64 in C (row-major) order, so that the eigenvalues for a given parameter value are contiguous
+        in memory.
     system_params: dict
         info about system parameters
     state_table: ndarray or list, optional
@@ -207,14 +390,90 @@ class SpectrumData(DataStore):
         matrix element data stored for each `param_vals` point
     """
     def __init__(self, param_name, param_vals, energy_table, system_params, state_table=None, matrixelem_table=None):
-        super().__init__(param_name, param_vals, system_params)
-        self.energy_table = energy_table
-        self.state_table = state_table
-        self.matrixelem_table = matrixelem_table
+        super().__init__(param_name, param_vals, system_params, energy_table=self._as_energy_table(energy_table),
+                         state_table=state_table, matrixelem_table=matrixelem_table)
+        self._deriv_cache = {}
+
+    @staticmethod
+    def _as_energy_table(energy_table):
+        """Converts energy data to a C-contiguous float64 ndarray, so that subsequent operations on the energy table
+        do not require casts or relayout. Imaginary parts, which may arise as numerical artifacts, are discarded."""
+        if energy_table is None or isinstance(energy_table, h5py.Dataset):
+            # no energy data, or data set read on demand from file (see `DataStore.create_from_file`)
+            return energy_table
+        energy_table = np.asarray(energy_table)
+        if np.iscomplexobj(energy_table):
+            if np.any(energy_table.imag):
+                warnings.warn('Energy data with nonzero imaginary parts: imaginary parts are discarded.')
+            energy_table = energy_table.real
+        return np.ascontiguousarray(energy_table, dtype=np.float_)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__dict__.get('_data_store', ()):
+            # derived data are no longer valid once spectral data are replaced
+            super().__setattr__('_deriv_cache', {})
+
+    def set_from_data(self, *data_from_file):
+        super().set_from_data(*data_from_file)
+        self._deriv_cache = {}
+
+    @classmethod
+    def _fast_init_from_data(cls, *data_from_file):
+        metadata_dict, name_list, data_list = data_from_file
+        data_dict = {'energy_table': None, 'state_table': None, 'matrixelem_table': None}
+        data_dict.update(zip(name_list, data_list))
+        new_object = super()._fast_init_from_data(metadata_dict, list(data_dict), list(data_dict.values()))
+        new_object._deriv_cache = {}
+        return new_object
+
+    def get_derived_data(self, param_index, data_key, compute_func):
+        """Returns data derived from the stored spectral data, such as matrix elements, for the parameter value with
+        index `param_index`. Data are computed via `compute_func` upon first request and cached for subsequent calls.
+        The cache is cleared whenever any of the spectral data sets is reassigned.
+
+        Parameters
+        ----------
+        param_index: int or None
+            index of the parameter value; None for data pertaining to the full parameter range
+        data_key: hashable
+            identifier of the derived data, e.g. the name of the operator
+        compute_func: function
+            signature: `compute_func()`, computes the derived data
+
+        Returns
+        -------
+        object
+        """
+        cache_key = (param_index, data_key)
+        if cache_key not in self._deriv_cache:
+            self._deriv_cache[cache_key] = compute_func()
+        return self._deriv_cache[cache_key]
+
+    @property
+    def state_table_asarray(self):
+        """ndarray or None: `state_table` converted to a numerical ndarray. The conversion (costly for a list of
+        qutip.qobj) is cached until `state_table` is reassigned."""
+        if self.state_table is None:
+            return None
+        return self.get_derived_data(None, 'state_table_asarray', lambda: convert_to_ndarray(self.state_table))
+
+    def _data_as_ndarray(self, data_name, data):
+        if data_name == 'state_table':
+            return self.state_table_asarray
+        return super()._data_as_ndarray(data_name, data)
 
     def subtract_ground(self):
-        """Subtract ground state energies from spectrum"""
-        self.energy_table -= self.energy_table[:, 0]
+        """Subtract ground state energies from spectrum (in place)"""
+        if isinstance(self.energy_table, h5py.Dataset):
+            raise ValueError('Energy data read via create_from_file(..., mmap=True) are read-only; cannot subtract '
+                             'ground state energies in place.')
+        if kernels.NUMBA_ENABLED and self.energy_table.size > kernels.KERNEL_MIN_SIZE:
+            kernels.subtract_ground(self.energy_table)
+        else:
+            ground_energies = self.energy_table[:, 0, None]
+            np.subtract(self.energy_table, ground_energies, out=self.energy_table)
+        self._deriv_cache = {}
 
     def plot_evals_vs_paramvals(self, which=-1, subtract_ground=False, label_list=None, **kwargs):
         """Plots eigenvalues of as a function of one parameter, as stored in SpectrumData object.
@@ -35,7 +35,8 @@ def generate_charge_matrixelem_sweep(sweep):
     for qbt_index, subsys in sweep.hilbertspace.qbt_subsys_list:
         if type(subsys).__name__ in ['Transmon', 'Fluxonium']:
             sweep.compute_custom_data_sweep('n_op_qbt{}'.format(qbt_index), obs.qubit_matrixelement,
-                                            qubit_subsys=subsys, qubit_operator=subsys.n_operator())
+                                            qubit_subsys=subsys, qubit_operator=subsys.n_operator(),
+                                            operator_key='n_operator')
 
 
 # **********************************************************************************************************************
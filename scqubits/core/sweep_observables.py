@@ -36,8 +36,8 @@ def dispersive_chi(sweep, param_index, qubit_subsys, osc_subsys, chi_indices=Non
     float or ndarray
         chi_i - chi_j   or   chi_0, chi_1, ...
     """
-    qubitsys_index = sweep.hilbertspace.get_subsys_index(qubit_subsys)
-    oscsys_index = sweep.hilbertspace.get_subsys_index(osc_subsys)
+    qubitsys_index = sweep.get_subsys_index(qubit_subsys)
+    oscsys_index = sweep.get_subsys_index(osc_subsys)
     if chi_indices is not None:
         chi_count = 2
         chi_range = chi_indices
@@ -63,7 +63,7 @@ def dispersive_chi(sweep, param_index, qubit_subsys, osc_subsys, chi_indices=Non
     return chi_values
 
 
-def qubit_matrixelement(sweep, param_index, qubit_subsys, qubit_operator):
+def qubit_matrixelement(sweep, param_index, qubit_subsys, qubit_operator, operator_key=None):
     """
     For given ParameterSweep and parameter_index, calculate the matrix elements for the provided qubit operator.
 
@@ -74,10 +74,21 @@ def qubit_matrixelement(sweep, param_index, qubit_subsys, qubit_operator):
     qubit_subsys: QuantumSystem
     qubit_operator: ndarray
        operator within the qubit subspace
+    operator_key: hashable, optional
+        if given, the matrix elements are cached under this key with the bare spectral data of `qubit_subsys`, and
+        reused by subsequent calls with the same key
 
     Returns
     -------
     ndarray
     """
-    bare_evecs = sweep.lookup.bare_eigenstates(param_index, qubit_subsys)
-    return spectrum_utils.get_matrixelement_table(qubit_operator, bare_evecs)
+    def compute_matrixelements():
+        bare_evecs = sweep.lookup.bare_eigenstates(param_index, qubit_subsys)
+        return spectrum_utils.get_matrixelement_table(qubit_operator, bare_evecs)
+
+    if operator_key is None:
+        return compute_matrixelements()
+    bare_specdata = sweep.bare_specdata_list[sweep.get_subsys_index(qubit_subsys)]
+    # bare eigenstates of subsystems not updated in the sweep are the same for all parameter values
+    cache_index = param_index if qubit_subsys in sweep.subsys_update_list else None
+    return bare_specdata.get_derived_data(cache_index, operator_key, compute_matrixelements)
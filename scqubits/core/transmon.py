@@ -43,6 +43,8 @@ class Transmon(QubitBaseClass1d):
     truncated_dim: int, optional
         desired dimension of the truncated quantum system
     """
+    # methods returning WaveFunction instances obtained via `WaveFunction.acquire`, see `_release_wavefunction`
+    _transient_wavefunction_methods = ('wavefunction', 'numberbasis_wavefunction')
 
     def __init__(self, EJ, EC, ng, ncut, truncated_dim=None):
         self.EJ = EJ
@@ -132,7 +134,10 @@ class Transmon(QubitBaseClass1d):
         amplitude_modifier = constants.MODE_FUNC_DICT[mode]
         n_wavefunc.amplitudes = amplitude_modifier(n_wavefunc.amplitudes)
         kwargs = {**defaults.wavefunction1d_discrete(mode), **kwargs}    # if any duplicates, later ones survive
-        return plot.wavefunction1d_discrete(n_wavefunc, xlim=nrange, **kwargs)
+        try:
+            return plot.wavefunction1d_discrete(n_wavefunc, xlim=nrange, **kwargs)
+        finally:
+            self._release_wavefunction(n_wavefunc, 'numberbasis_wavefunction')
 
     def plot_phi_wavefunction(self, esys=None, which=0, phi_grid=None, mode='abs_sqr', scaling=None, **kwargs):
         """Alias for plot_wavefunction"""
@@ -160,7 +165,7 @@ class Transmon(QubitBaseClass1d):
         evals, evecs = esys
 
         n_vals = np.arange(-self.ncut, self.ncut + 1)
-        return WaveFunction(n_vals, evecs[:, which], evals[which])
+        return WaveFunction.acquire(n_vals, evecs[:, which], evals[which])
 
     def wavefunction(self, esys=None, which=0, phi_grid=None):
         """Return the transmon wave function in phase basis. The specific index of the wavefunction is `which`.
@@ -194,4 +199,6 @@ class Transmon(QubitBaseClass1d):
             phi_wavefunc_amplitudes[k] = ((1j**which / math.sqrt(2 * np.pi)) *
                                           np.sum(n_wavefunc.amplitudes *
                                                  np.exp(1j * phi_basis_labels[k] * n_wavefunc.basis_labels)))
-        return WaveFunction(basis_labels=phi_basis_labels, amplitudes=phi_wavefunc_amplitudes, energy=evals[which])
+        self._release_wavefunction(n_wavefunc, 'numberbasis_wavefunction')
+        return WaveFunction.acquire(basis_labels=phi_basis_labels, amplitudes=phi_wavefunc_amplitudes,
+                                    energy=evals[which])
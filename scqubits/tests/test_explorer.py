@@ -10,14 +10,16 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import matplotlib.pyplot as plt
 import numpy as np
 
 import scqubits as qubit
+import scqubits.core.explorer as explorer_module
 import scqubits.core.sweep_generators as swp
 from scqubits import InteractionTerm, ParameterSweep, Explorer
 
 
-def test_explorer():
+def make_sweep(param_vals):
     qbt = qubit.Fluxonium(
         EJ=2.55,
         EC=0.72,
@@ -47,14 +49,13 @@ def test_explorer():
     hilbertspace.interaction_list = interaction_list
 
     param_name = r'$\Phi_{ext}/\Phi_0$'
-    param_vals = np.linspace(-0.5, 0.5, 100)
 
     subsys_update_list = [qbt]
 
     def update_hilbertspace(param_val):
         qbt.flux = param_val
 
-    sweep = ParameterSweep(
+    return ParameterSweep(
         param_name=param_name,
         param_vals=param_vals,
         evals_count=10,
@@ -62,6 +63,11 @@ def test_explorer():
         subsys_update_list=subsys_update_list,
         update_hilbertspace=update_hilbertspace,
     )
+
+
+def test_explorer():
+    param_vals = np.linspace(-0.5, 0.5, 100)
+    sweep = make_sweep(param_vals)
     swp.generate_chi_sweep(sweep)
     swp.generate_charge_matrixelem_sweep(sweep)
 
@@ -71,3 +77,42 @@ def test_explorer():
     )
 
     explorer.interact()
+
+    # charge matrix elements are cached with the bare spectral data, and reused by further explorers
+    cache_size = len(sweep.bare_specdata_list[0]._deriv_cache)
+    assert cache_size == len(param_vals)
+    Explorer(sweep=sweep, evals_count=10)
+    assert len(sweep.bare_specdata_list[0]._deriv_cache) == cache_size
+
+
+def test_explorer_panel_updates(monkeypatch):
+    def has_marker(axes, param_val):
+        return any(np.array_equal(line.get_xdata(), [param_val, param_val]) for line in axes.lines)
+
+    param_vals = np.linspace(-0.5, 0.5, 41)
+    explorer = Explorer(sweep=make_sweep(param_vals), evals_count=10)
+
+    fig, axs = explorer.plot_explorer_panels(param_vals[10], 1, 0, 1, 0, 1)
+    line_counts = [len(axes.lines) for axes in axs.flat]
+    dressed_title = axs.flat[2].get_title()
+
+    # panels are updated in place within the same figure
+    fig_updated, axs_updated = explorer.plot_explorer_panels(param_vals[30], 1, 0, 2, 0, 1)
+    assert fig_updated is fig
+    assert [len(axes.lines) for axes in axs.flat] == line_counts
+    for panel_index in [0, 2, 3, 4, 5]:
+        assert has_marker(axs.flat[panel_index], param_vals[30])
+        assert not has_marker(axs.flat[panel_index], param_vals[10])
+    assert axs.flat[2].get_title() != dressed_title
+    lookup = explorer.sweep.lookup
+    energy_difference = lookup.energy_dressed_index(2, 30) - lookup.energy_dressed_index(0, 30)
+    assert str(lookup.bare_index(2, 30)) in axs.flat[2].get_title()
+    assert '{:.4f}'.format(energy_difference) in axs.flat[2].get_title()
+
+    # a figure closed by the backend is shown again
+    displayed_figs = []
+    monkeypatch.setattr(explorer_module, 'display', displayed_figs.append)
+    plt.close(fig)
+    fig_updated, _ = explorer.plot_explorer_panels(param_vals[20], 1, 0, 1, 0, 1)
+    assert fig_updated is fig
+    assert displayed_figs == [fig]
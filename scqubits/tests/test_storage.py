@@ -0,0 +1,227 @@
+# test_storage.py
+# meant to be run with 'pytest'
+#
+# This file is part of scqubits.
+#
+#    Copyright (c) 2019, Jens Koch and Peter Groszkowski
+#    All rights reserved.
+#
+#    This source code is licensed under the BSD-style license found in the
+#    LICENSE file in the root directory of this source tree.
+############################################################################
+
+import copy
+
+import h5py
+import numpy as np
+import pytest
+
+import scqubits
+import scqubits.core.storage as storage
+import scqubits.utils.file_io as io
+from scqubits.core.storage import SpectrumData, WaveFunction
+
+
+def test_subtract_ground():
+    energy_table = np.asarray([[1.0, 2.0, 4.0], [-1.0, 0.5, 3.0]])
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), energy_table, {})
+    specdata.subtract_ground()
+    assert np.allclose(specdata.energy_table, [[0.0, 1.0, 3.0], [0.0, 1.5, 4.0]])
+    assert specdata.energy_table.flags['C_CONTIGUOUS']
+
+
+def test_relayout_fortran_ordered_data():
+    state_table = np.asfortranarray(np.arange(24.0).reshape(4, 3, 2))
+    specdata = SpectrumData('ng', np.linspace(0.0, 1.0, 4), np.zeros((4, 2)), {}, state_table=state_table)
+    assert specdata.state_table.flags['C_CONTIGUOUS']
+    assert np.array_equal(specdata.state_table, state_table)
+
+
+def test_no_relayout_without_parameter_axis():
+    evecs = np.asfortranarray(np.arange(6.0).reshape(3, 2))
+    specdata = SpectrumData('const_parameters', np.empty(0), np.arange(2.0), {}, state_table=evecs)
+    assert specdata.state_table is evecs
+
+
+def test_data_dict_tracks_attribute_assignment():
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), np.zeros((2, 3)), {})
+    specdata_copy = copy.copy(specdata)
+    specdata_copy.matrixelem_table = np.ones((2, 3, 3))
+    assert specdata_copy._get_data_dict()['matrixelem_table'] is specdata_copy.matrixelem_table
+    assert specdata._get_data_dict()['matrixelem_table'] is None
+
+
+def test_filewrite_roundtrip(tmpdir):
+    param_vals = np.linspace(0.0, 1.0, 5)
+    energy_table = np.random.rand(5, 4)
+    state_table = np.random.rand(5, 6, 4) + 1j * np.random.rand(5, 6, 4)
+    specdata = SpectrumData('ng', param_vals, energy_table, {'EJ': 20.0}, state_table=state_table)
+    specdata.filewrite(str(tmpdir.join('roundtrip')))
+
+    specdata_read = SpectrumData.create_from_file(str(tmpdir.join('roundtrip')))
+    assert specdata_read.param_name == 'ng'
+    assert np.allclose(specdata_read.param_vals, param_vals)
+    assert np.allclose(specdata_read.energy_table, energy_table)
+    assert np.allclose(specdata_read.state_table, state_table)
+
+
+def test_filewrite_partitioned_roundtrip(tmpdir):
+    param_vals = np.linspace(0.0, 1.0, 5)
+    energy_table = np.random.rand(5, 4)
+    specdata = SpectrumData('ng', param_vals, energy_table, {'EJ': 20.0})
+    specdata.filewrite(str(tmpdir.join('partitioned')), parallel=True)
+    assert tmpdir.join('partitioned.part0.hdf5').check()
+
+    specdata_read = SpectrumData.create_from_file(str(tmpdir.join('partitioned')))
+    assert np.allclose(specdata_read.energy_table, energy_table)
+
+
+def test_derived_data_cache():
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), np.zeros((2, 3)), {})
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert specdata.get_derived_data(0, 'n_operator', compute) == 1
+    assert specdata.get_derived_data(0, 'n_operator', compute) == 1
+    specdata.energy_table = np.ones((2, 3))
+    assert specdata.get_derived_data(0, 'n_operator', compute) == 2
+
+
+def test_state_table_conversion_cached():
+    state_table = [np.eye(3) for _ in range(2)]
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), np.zeros((2, 3)), {}, state_table=state_table)
+    converted = specdata.state_table_asarray
+    assert converted.shape == (2, 3, 3)
+    assert specdata.state_table_asarray is converted
+    specdata.state_table = [np.eye(3) for _ in range(2)]
+    assert specdata.state_table_asarray is not converted
+
+
+def test_energy_table_normalized_to_float64():
+    energy_table = np.asarray([[0.0, 1.0], [0.5, 1.5]], dtype=np.float32)
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), energy_table, {})
+    assert specdata.energy_table.dtype == np.float64
+
+    with pytest.warns(UserWarning):
+        specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), energy_table + 1e-12j, {})
+    assert specdata.energy_table.dtype == np.float64
+    assert specdata.energy_table.flags['C_CONTIGUOUS']
+    assert np.allclose(specdata.energy_table, energy_table)
+
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), None, {})
+    assert specdata.energy_table is None
+    assert 'energy_table' not in dict(filter(storage.value_not_none, specdata._get_data_dict().items()))
+
+
+def test_wavefunction_pool_reuse():
+    wavefunc = WaveFunction.acquire(np.arange(3), np.ones(3), energy=1.0)
+    wavefunc.release()
+    assert wavefunc.amplitudes is None
+    reused_wavefunc = WaveFunction.acquire(np.arange(4), np.zeros(4))
+    assert reused_wavefunc is wavefunc
+    assert reused_wavefunc.energy is None
+    assert np.array_equal(reused_wavefunc.amplitudes, np.zeros(4))
+
+
+def test_wavefunction_pool_subclasses():
+    class CustomWaveFunction(WaveFunction):
+        __slots__ = ()
+
+    WaveFunction.acquire(np.arange(3), np.ones(3)).release()
+    wavefunc = CustomWaveFunction.acquire(np.arange(3), np.ones(3))
+    assert type(wavefunc) is CustomWaveFunction
+    wavefunc.release()
+    assert all(type(pooled) is WaveFunction for pooled in storage._WAVEFN_POOL)
+
+
+def test_cached_wavefunction_not_released():
+    class CachedTransmon(scqubits.Transmon):
+        def wavefunction(self, esys=None, which=0, phi_grid=None):
+            if which not in self.wavefunc_cache:
+                self.wavefunc_cache[which] = super().wavefunction(esys, which=which, phi_grid=phi_grid)
+            return self.wavefunc_cache[which]
+
+    transmon = CachedTransmon(EJ=30.0, EC=1.2, ng=0.3, ncut=31, truncated_dim=4)
+    transmon.wavefunc_cache = {}
+    transmon.plot_wavefunction(which=1)
+    assert transmon.wavefunc_cache[1].amplitudes is not None
+
+
+def test_parallel_relayout(monkeypatch):
+    monkeypatch.setattr(storage.os, 'cpu_count', lambda: 4)
+    # state table for 400 parameter values, Hilbert space dimension 150, 150 eigenstates
+    state_table = np.asfortranarray(np.arange(400 * 150 * 150, dtype=np.float_).reshape(400, 150, 150))
+    assert state_table.nbytes > storage.PARALLEL_RELAYOUT_NBYTES
+    specdata = SpectrumData('ng', np.linspace(0.0, 1.0, 400), np.zeros((400, 150)), {}, state_table=state_table)
+    assert specdata.state_table.flags['C_CONTIGUOUS']
+    assert np.array_equal(specdata.state_table, state_table)
+
+
+def test_create_from_file_mmap(tmpdir):
+    param_vals = np.linspace(0.0, 1.0, 5)
+    energy_table = np.random.rand(5, 4)
+    specdata = SpectrumData('ng', param_vals, energy_table, {'EJ': 20.0})
+    specdata.filewrite(str(tmpdir.join('mmap')))
+
+    with SpectrumData.create_from_file(str(tmpdir.join('mmap')), mmap=True) as specdata_read:
+        assert isinstance(specdata_read.energy_table, h5py.Dataset)
+        assert np.allclose(specdata_read.energy_table[2], energy_table[2])
+        assert np.allclose(specdata_read.energy_table[:, 1], energy_table[:, 1])
+        with pytest.raises(ValueError, match='read-only'):
+            specdata_read.subtract_ground()
+    assert not specdata_read.energy_table
+    # the file is closed, and can be overwritten
+    specdata.filewrite(str(tmpdir.join('mmap')))
+
+
+@pytest.mark.skipif(not storage.kernels.NUMBA_ENABLED, reason='numba not installed')
+def test_subtract_ground_kernel(monkeypatch):
+    monkeypatch.setattr(storage.kernels, 'KERNEL_MIN_SIZE', 0)
+    energy_table = np.random.rand(6, 4)
+    specdata = SpectrumData('ng', np.linspace(0.0, 1.0, 6), energy_table.copy(), {})
+    specdata.subtract_ground()
+    assert np.allclose(specdata.energy_table, energy_table - energy_table[:, 0, None])
+
+
+def test_metadata_dict_cached(monkeypatch):
+    calls = []
+
+    def process_metadata(system_params):
+        calls.append(1)
+        return dict(system_params)
+
+    monkeypatch.setattr(storage, 'process_metadata', process_metadata)
+    specdata = SpectrumData('ng', np.asarray([0.0, 0.5]), np.zeros((2, 3)), {'EJ': 20.0})
+    specdata._get_metadata_dict()
+    assert specdata._get_metadata_dict()['EJ'] == 20.0
+    assert len(calls) == 1
+    specdata.system_params = {'EJ': 10.0}
+    assert specdata._get_metadata_dict()['EJ'] == 10.0
+    assert len(calls) == 2
+
+
+def test_create_from_files(tmpdir):
+    param_vals = np.linspace(0.0, 1.0, 5)
+    energy_tables = [np.random.rand(5, 4) for _ in range(3)]
+    filenames = [str(tmpdir.join('snapshot{}'.format(index))) for index in range(3)]
+    for energy_table, filename in zip(energy_tables, filenames):
+        SpectrumData('ng', param_vals, energy_table, {'EJ': 20.0}).filewrite(filename)
+
+    specdata_list = SpectrumData.create_from_files(filenames)
+    for specdata, energy_table in zip(specdata_list, energy_tables):
+        assert isinstance(specdata, SpectrumData)
+        assert np.allclose(specdata.energy_table, energy_table)
+        assert specdata.state_table is None
+        assert specdata._get_metadata_dict()['EJ'] == 20.0
+        specdata.subtract_ground()
+        assert np.allclose(specdata.energy_table[:, 0], 0.0)
+
+
+def test_h5_chunks_span_parameter_blocks():
+    options = io.H5Writer.dataset_options(np.zeros((20000, 10)))
+    assert options['chunks'] == (io.CHUNK_TARGET_NBYTES // 80, 10)
+    options = io.H5Writer.dataset_options(np.zeros((5, 4)))
+    assert options['chunks'] == (5, 4)
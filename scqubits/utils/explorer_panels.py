@@ -9,49 +9,191 @@
 #    LICENSE file in the root directory of this source tree.
 ############################################################################
 
+import weakref
+
+import matplotlib.pyplot as plt
+
 import scqubits.utils.sweep_plotting as splot
 from scqubits.settings import DEFAULT_ENERGY_UNITS
 
+# For each panel Axes: key identifying the content plotted on it, and the overlay artists (axvline, scatter) that mark
+# the current parameter value. Only the overlays are updated as long as the key is unchanged.
+_panel_cache = weakref.WeakKeyDictionary()
+
+# Panel title templates. Static fields are substituted once per sweep via str.format (see `_panel_title`); fields
+# changing with the parameter value are substituted via %-formatting.
+_BARE_SPECTRUM_TITLE = 'bare spectrum: subsystem {} ({})'
+_WAVEFUNCTIONS_TITLE = 'wavefunctions: subsystem {} ({})'
+_DRESSED_SPECTRUM_TITLE = r'{} $\rightarrow$ {}: %.4f ' + DEFAULT_ENERGY_UNITS
+_N_PHOTON_TITLE = r'{}-photon qubit transitions, {} $\rightarrow$'
+_CHI_01_TITLE = r'$\chi_{01}=$%.4f ' + DEFAULT_ENERGY_UNITS
+_CHARGE_MATRIXELEMS_TITLE = r'charge matrix elements for {} [{}]'
+
+
+class ExplorerPanelBatch:
+    """Context manager for updating several panels at once. Panel updates within the context only modify artists;
+    each affected figure is redrawn once upon exit, rather than once per panel."""
+    _active_batch = None
+
+    def __init__(self):
+        self._figures = set()
+
+    def __enter__(self):
+        self._outer_batch = ExplorerPanelBatch._active_batch
+        ExplorerPanelBatch._active_batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        ExplorerPanelBatch._active_batch = self._outer_batch
+        for figure in self._figures:
+            _redraw(figure)
+
+    def add_figure(self, figure):
+        self._figures.add(figure)
+
+
+def _redraw(figure):
+    """Requests redrawing of `figure`, unless the backend has already closed it (e.g., inline backend)"""
+    if plt.fignum_exists(figure.number):
+        figure.canvas.draw_idle()
+
+
+def _request_redraw(axes):
+    """Redraws the figure containing `axes`, deferring the redraw to the end of an active ExplorerPanelBatch"""
+    if ExplorerPanelBatch._active_batch is not None:
+        ExplorerPanelBatch._active_batch.add_figure(axes.figure)
+    else:
+        _redraw(axes.figure)
+
+
+def _get_overlays(axes, panel_key):
+    """Returns the cached overlay artists (line_artist, scatter_artist) for `axes`, or None if the panel content
+    identified by `panel_key` has not been plotted on `axes` yet."""
+    cache_entry = _panel_cache.get(axes)
+    if cache_entry is not None and cache_entry[0] == panel_key:
+        return cache_entry[1]
+    return None
+
+
+def _store_overlays(axes, panel_key, line_artist, scatter_artist=None):
+    _panel_cache[axes] = (panel_key, (line_artist, scatter_artist))
+    return line_artist, scatter_artist
+
+
+def _panel_title(sweep, title_key, template, *args):
+    """Returns `template` with its static fields substituted by `args`. The result is cached on `sweep` under
+    `title_key`."""
+    try:
+        return sweep._panel_titles[title_key]
+    except KeyError:
+        title = sweep._panel_titles[title_key] = template.format(*args)
+        return title
+
+
+def clear_panel(fig_ax):
+    """Removes all content from the panel and discards its cached artists."""
+    axes = fig_ax[1]
+    axes.clear()
+    _panel_cache.pop(axes, None)
+
 
 def display_bare_spectrum(sweep, subsys, param_val, fig_ax):
-    title = 'bare spectrum: subsystem {} ({})'.format(sweep.hilbertspace.index(subsys), subsys._sys_type)
-    __ = splot.bare_spectrum(sweep, subsys, title=title, fig_ax=fig_ax)
-    _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    axes = fig_ax[1]
+    panel_key = (id(sweep), 'bare_spectrum', id(subsys))
+    overlays = _get_overlays(axes, panel_key)
+    if overlays is None:
+        clear_panel(fig_ax)
+        title = _panel_title(sweep, ('bare_spectrum', id(subsys)), _BARE_SPECTRUM_TITLE,
+                             sweep.get_subsys_index(subsys), subsys._sys_type)
+        splot.bare_spectrum(sweep, subsys, title=title, fig_ax=fig_ax)
+        _store_overlays(axes, panel_key, axes.axvline(param_val, color='gray', linestyle=':'))
+    else:
+        line_artist, _ = overlays
+        line_artist.set_xdata([param_val, param_val])
+    _request_redraw(axes)
+
 
 
 def display_bare_wavefunctions(sweep, subsys, param_val, fig_ax):
-    title = 'wavefunctions: subsystem {} ({})'.format(sweep.hilbertspace.index(subsys), subsys._sys_type)
-    __ = splot.bare_wavefunction(sweep, param_val, subsys, title=title, fig_ax=fig_ax)
+    clear_panel(fig_ax)
+    title = _panel_title(sweep, ('wavefunctions', id(subsys)), _WAVEFUNCTIONS_TITLE,
+                         sweep.get_subsys_index(subsys), subsys._sys_type)
+    splot.bare_wavefunction(sweep, param_val, subsys, title=title, fig_ax=fig_ax)
+    _request_redraw(fig_ax[1])
+
 
 
 def display_dressed_spectrum(sweep, initial_bare, final_bare, energy_initial, energy_final, param_val, fig_ax):
     energy_difference = energy_final - energy_initial
-    title = r'{} $\rightarrow$ {}: {:.4f} {}'.format(initial_bare, final_bare, energy_difference, DEFAULT_ENERGY_UNITS)
-    __ = splot.dressed_spectrum(sweep, title=title, fig_ax=fig_ax)
-    _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
-    axes.scatter([param_val] * 2, [energy_initial, energy_final], s=40, c='gray')
+    title = _panel_title(sweep, ('dressed_spectrum', initial_bare, final_bare), _DRESSED_SPECTRUM_TITLE,
+                         initial_bare, final_bare) % energy_difference
+    axes = fig_ax[1]
+    panel_key = (id(sweep), 'dressed_spectrum')
+    overlays = _get_overlays(axes, panel_key)
+    if overlays is None:
+        clear_panel(fig_ax)
+        splot.dressed_spectrum(sweep, title=title, fig_ax=fig_ax)
+        _store_overlays(axes, panel_key, axes.axvline(param_val, color='gray', linestyle=':'),
+                        axes.scatter([param_val] * 2, [energy_initial, energy_final], s=40, c='gray'))
+    else:
+        line_artist, scatter_artist = overlays
+        line_artist.set_xdata([param_val, param_val])
+        scatter_artist.set_offsets([[param_val, energy_initial], [param_val, energy_final]])
+        axes.set_title(title)
+    _request_redraw(axes)
+
 
 
 def display_n_photon_qubit_transitions(sweep, photonnumber, initial_bare, param_val, fig_ax):
-    title = r'{}-photon qubit transitions, {} $\rightarrow$'.format(photonnumber, initial_bare)
-    __ = splot.n_photon_qubit_spectrum(sweep, photonnumber, initial_state_labels=initial_bare,
-                                       title=title, fig_ax=fig_ax)
-    _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    axes = fig_ax[1]
+    panel_key = (id(sweep), 'n_photon_qubit_transitions', photonnumber, initial_bare)
+    overlays = _get_overlays(axes, panel_key)
+    if overlays is None:
+        clear_panel(fig_ax)
+        title = _panel_title(sweep, ('n_photon', photonnumber, initial_bare), _N_PHOTON_TITLE,
+                             photonnumber, initial_bare)
+        splot.n_photon_qubit_spectrum(sweep, photonnumber, initial_state_labels=initial_bare, title=title,
+                                      fig_ax=fig_ax)
+        _store_overlays(axes, panel_key, axes.axvline(param_val, color='gray', linestyle=':'))
+    else:
+        line_artist, _ = overlays
+        line_artist.set_xdata([param_val, param_val])
+    _request_redraw(axes)
+
 
 
 def display_chi_01(sweep, qbt_index, osc_index, param_index, fig_ax):
-    __ = splot.chi_01(sweep, qbt_index, osc_index, param_index=param_index, fig_ax=fig_ax)
-    _, axes = fig_ax
-    axes.axvline(sweep.param_vals[param_index], color='gray', linestyle=':')
+    axes = fig_ax[1]
+    param_val = sweep.param_vals[param_index]
+    chi_01 = sweep.sweep_data['chi_osc{}_qbt{}'.format(osc_index, qbt_index)][param_index]
+    title = _CHI_01_TITLE % chi_01
+    panel_key = (id(sweep), 'chi_01', qbt_index, osc_index)
+    overlays = _get_overlays(axes, panel_key)
+    if overlays is None:
+        clear_panel(fig_ax)
+        splot.chi_01(sweep, qbt_index, osc_index, param_index=param_index, title=title, fig_ax=fig_ax)
+        _store_overlays(axes, panel_key, axes.axvline(param_val, color='gray', linestyle=':'))
+    else:
+        line_artist, _ = overlays
+        line_artist.set_xdata([param_val, param_val])
+        axes.set_title(title)
+    _request_redraw(axes)
+
 
 
 def display_charge_matrixelems(sweep, initial_bare, qbt_subsys, param_val, fig_ax):
-    qbt_index = sweep.hilbertspace.index(qbt_subsys)
+    axes = fig_ax[1]
+    qbt_index = sweep.get_subsys_index(qbt_subsys)
     bare_qbt_initial = initial_bare[qbt_index]
-    title = r'charge matrix elements for {} [{}]'.format(type(qbt_subsys).__name__, qbt_index)
-    __ = splot.charge_matrixelem(sweep, qbt_index, bare_qbt_initial, title=title, fig_ax=fig_ax)
-    _, axes = fig_ax
-    axes.axvline(param_val, color='gray', linestyle=':')
+    panel_key = (id(sweep), 'charge_matrixelems', qbt_index, bare_qbt_initial)
+    overlays = _get_overlays(axes, panel_key)
+    if overlays is None:
+        clear_panel(fig_ax)
+        title = _panel_title(sweep, ('charge_matrixelems', qbt_index), _CHARGE_MATRIXELEMS_TITLE,
+                             type(qbt_subsys).__name__, qbt_index)
+        splot.charge_matrixelem(sweep, qbt_index, bare_qbt_initial, title=title, fig_ax=fig_ax)
+        _store_overlays(axes, panel_key, axes.axvline(param_val, color='gray', linestyle=':'))
+    else:
+        line_artist, _ = overlays
+        line_artist.set_xdata([param_val, param_val])
+    _request_redraw(axes)
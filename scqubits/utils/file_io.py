@@ -20,14 +20,34 @@ import numpy as np
 
 from scqubits.settings import FileType
 
+try:
+    import hdf5plugin   # registers the bitshuffle filter with HDF5
+except ImportError:
+    pass
+
+try:
+    from mpi4py import MPI
+    _MPI_ENABLED = True
+except ImportError:
+    _MPI_ENABLED = False
+
+BITSHUFFLE_FILTER_ID = 32008
+BITSHUFFLE_LZ4_OPTS = (0, 2)   # automatic block size, LZ4 compression after bitshuffle
+_BITSHUFFLE_ENABLED = h5py.h5z.filter_avail(BITSHUFFLE_FILTER_ID)
+
+# approximate size (in bytes) of the chunks multi-dimensional data sets are written in, see `H5Writer.dataset_options`
+CHUNK_TARGET_NBYTES = 2**16
+
 
 class FileIOFactory:
     """Factory method for choosing reader/writer according to given format"""
-    def get_writer(self, file_format):
+    def get_writer(self, file_format, parallel=False):
+        if parallel and file_format is not FileType.h5:
+            raise ValueError('Partitioned writing is only supported for the h5 file format.')
         if file_format is FileType.csv:
             return CsvWriter()
         if file_format is FileType.h5:
-            return H5Writer()
+            return PartitionedH5Writer() if parallel else H5Writer()
 
     def get_reader(self, file_format):
         if file_format is FileType.csv:
@@ -41,19 +61,21 @@ factory = FileIOFactory()
 
 class ObjectWriter:
     """Sets up the appropriate writer, calls the object's serializer to obtain data, then writes to file."""
-    def filewrite(self, the_object, file_format, filename):
+    def filewrite(self, the_object, file_format, filename, parallel=False):
         """
         Parameters
         ----------
         the_object: object
         file_format: FileType
         filename: str
+        parallel: bool, optional
+            if True, use partitioned writing (h5 only, see `PartitionedH5Writer`)
 
         Returns
         -------
         exit_info
         """
-        writer = factory.get_writer(file_format)
+        writer = factory.get_writer(file_format, parallel)
         the_object._serialize(writer)
         return writer.do_writing(filename)
 
@@ -73,18 +95,42 @@ class ObjectReader:
         extracted_data = reader.do_reading(filename)
         the_object.set_from_data(*extracted_data)
 
-    def create_from_file(self, class_object, file_format, filename):
+    def create_from_file(self, class_object, file_format, filename, mmap=False):
         """
         Parameters
         ----------
         class_object: class
         file_format: FileType
         filename: str
+        mmap: bool, optional
+            if True, data sets are not read into memory, but accessed on demand from file (h5 only)
         """
+        if mmap and file_format is not FileType.h5:
+            raise ValueError('Memory-mapped reading is only supported for the h5 file format.')
         reader = factory.get_reader(file_format)
+        if mmap:
+            h5file, extracted_data = reader.do_lazy_reading(filename)
+            try:
+                new_object = class_object._init_from_data(*extracted_data)
+            except Exception:
+                h5file.close()
+                raise
+            new_object._h5file = h5file   # data sets are only accessible while the file remains open, see `close`
+            return new_object
         extracted_data = reader.do_reading(filename)
         return class_object._init_from_data(*extracted_data)
 
+    def create_from_files(self, class_object, file_format, filenames):
+        """
+        Parameters
+        ----------
+        class_object: class
+        file_format: FileType
+        filenames: list(str)
+        """
+        reader = factory.get_reader(file_format)
+        return [class_object._fast_init_from_data(*reader.do_reading(filename)) for filename in filenames]
+
 
 class BaseWriter:
     def __init__(self):
@@ -120,6 +166,37 @@ class CsvWriter(BaseWriter):
 
 
 class H5Writer(BaseWriter):
+    @staticmethod
+    def dataset_options(dataset):
+        """Chunking and compression options for writing `dataset`. Multi-dimensional data are chunked in blocks of
+        whole rows along the leading (parameter) axis, with about `CHUNK_TARGET_NBYTES` per chunk: reading the data for
+        a single parameter value only touches one chunk, while chunks remain large enough for efficient compression
+        and for reading slices across all parameter values.
+        If the bitshuffle filter is available (e.g. via the `hdf5plugin` package), it is used with LZ4 compression;
+        otherwise, gzip compression with byte shuffling is used.
+
+        Parameters
+        ----------
+        dataset: ndarray
+
+        Returns
+        -------
+        dict
+            keyword arguments for `h5py.Group.create_dataset`
+        """
+        if dataset.ndim == 0 or dataset.size == 0:
+            return {}
+        options = {}
+        if dataset.ndim >= 2:
+            row_nbytes = max(1, dataset.nbytes // dataset.shape[0])
+            rows_per_chunk = min(dataset.shape[0], max(1, CHUNK_TARGET_NBYTES // row_nbytes))
+            options['chunks'] = (rows_per_chunk,) + dataset.shape[1:]
+        if _BITSHUFFLE_ENABLED:
+            options.update(compression=BITSHUFFLE_FILTER_ID, compression_opts=BITSHUFFLE_LZ4_OPTS)
+        else:
+            options.update(compression='gzip', shuffle=True)
+        return options
+
     def do_writing(self, filename):
         """
         Parameters
@@ -127,13 +204,74 @@ class H5Writer(BaseWriter):
         filename: str
         """
         filename_stub = os.path.splitext(filename)[0]
-        h5file = h5py.File(filename_stub + '.hdf5', 'w')
-        h5file_root = h5file.create_group('root')
+        with h5py.File(filename_stub + '.hdf5', 'w') as h5file:
+            h5file_root = h5file.create_group('root')
+            h5file_root.attrs.update(self._current_object_meta)
+
+            for dataname, dataset in self._current_object_data.items():
+                h5file_root.create_dataset(dataname, data=dataset, dtype=dataset.dtype,
+                                           **self.dataset_options(dataset))
+
+
+class PartitionedH5Writer(H5Writer):
+    """Writes data sets whose leading axis runs over the parameter values in partitions: each process (MPI rank, if
+    run under MPI via `mpi4py`; otherwise a single process) writes its slab of parameter values to a separate file
+    `<filename>.part<rank>.hdf5`. The main file `<filename>.hdf5` holds the metadata and presents each partitioned
+    data set as a single virtual data set, so that files can be read back as usual. Partition files must remain in
+    the same directory as the main file."""
+    @staticmethod
+    def part_filename(filename_stub, rank):
+        return '{}.part{}.hdf5'.format(filename_stub, rank)
+
+    def _partitioned_data(self):
+        param_count = len(self._current_object_meta['param_vals'])
+        return {dataname: dataset for dataname, dataset in self._current_object_data.items()
+                if param_count > 0 and dataset.ndim >= 1 and dataset.shape[0] == param_count}
 
-        h5file_root.attrs.update(self._current_object_meta)
+    def do_writing(self, filename):
+        """
+        Parameters
+        ----------
+        filename: str
+        """
+        comm = MPI.COMM_WORLD if _MPI_ENABLED else None
+        rank, size = (comm.Get_rank(), comm.Get_size()) if comm else (0, 1)
 
-        for dataname, dataset in self._current_object_data.items():
-            h5file_root.create_dataset(dataname, data=dataset, dtype=dataset.dtype, compression="gzip")
+        filename_stub = os.path.splitext(filename)[0]
+        param_count = len(self._current_object_meta['param_vals'])
+        bounds = np.linspace(0, param_count, size + 1).astype(int)
+        partitioned_data = self._partitioned_data()
+
+        start, stop = bounds[rank], bounds[rank + 1]
+        with h5py.File(self.part_filename(filename_stub, rank), 'w') as part_file:
+            for dataname, dataset in partitioned_data.items():
+                slab = dataset[start:stop]
+                part_file.create_dataset(dataname, data=slab, dtype=slab.dtype, **self.dataset_options(slab))
+        if comm:
+            comm.Barrier()
+
+        if rank == 0:
+            part_basename = os.path.basename(filename_stub)
+            with h5py.File(filename_stub + '.hdf5', 'w') as h5file:
+                h5file_root = h5file.create_group('root')
+                h5file_root.attrs.update(self._current_object_meta)
+
+                for dataname, dataset in self._current_object_data.items():
+                    if dataname not in partitioned_data:
+                        h5file_root.create_dataset(dataname, data=dataset, dtype=dataset.dtype,
+                                                   **self.dataset_options(dataset))
+                        continue
+                    layout = h5py.VirtualLayout(shape=dataset.shape, dtype=dataset.dtype)
+                    for part_rank in range(size):
+                        part_start, part_stop = bounds[part_rank], bounds[part_rank + 1]
+                        if part_start == part_stop:
+                            continue
+                        layout[part_start:part_stop] = h5py.VirtualSource(
+                            self.part_filename(part_basename, part_rank), dataname,
+                            shape=(part_stop - part_start,) + dataset.shape[1:])
+                    h5file_root.create_virtual_dataset(dataname, layout)
+        if comm:
+            comm.Barrier()
 
 
 class CsvReader:
@@ -164,3 +302,29 @@ class H5Reader:
             for key, value in h5file['root'].attrs.items():
                 metadata[key] = value
         return metadata, dataname_list, data_list
+
+    def do_lazy_reading(self, filename):
+        """Opens the file for reading, but returns the data sets as h5py.Dataset objects rather than ndarrays. These
+        support ndarray-like slicing, reading only the chunks needed from file. The file must remain open as long as
+        the data sets are in use.
+
+        Parameters
+        ----------
+        filename: str
+
+        Returns
+        -------
+        h5py.File, (dict, list, list)
+            open file, and tuple of: dictionary of metadata, list of dataset names, list of h5py.Dataset objects
+        """
+        filename_stub = os.path.splitext(filename)[0]
+        h5file = h5py.File(filename_stub + '.hdf5', 'r')
+        try:
+            h5file_root = h5file['root']
+            metadata = dict(h5file_root.attrs.items())
+            dataname_list = list(h5file_root.keys())
+            data_list = [h5file_root[dataname] for dataname in dataname_list]
+        except Exception:
+            h5file.close()
+            raise
+        return h5file, (metadata, dataname_list, data_list)
@@ -37,7 +37,7 @@ def bare_spectrum(sweep, subsys, which=-1, **kwargs):
     -------
     fig, axes
     """
-    subsys_index = sweep.hilbertspace.index(subsys)
+    subsys_index = sweep.get_subsys_index(subsys)
     specdata = sweep.bare_specdata_list[subsys_index]
     if which is None:
         which = subsys.truncated_dim
@@ -125,7 +125,7 @@ def bare_wavefunction(sweep, param_val, subsys, which=-1, phi_grid=None, **kwarg
     -------
     fig, axes
     """
-    subsys_index = sweep.hilbertspace.index(subsys)
+    subsys_index = sweep.get_subsys_index(subsys)
     sweep.update_hilbertspace(param_val)
 
     param_index = np.searchsorted(sweep.param_vals, param_val)
@@ -55,17 +55,19 @@ REQUIRES = ['cython (>=0.28.5)',
             'scipy (>=1.1.0)',
             'matplotlib (>=3.0.0)',
             'qutip (>=4.3.1)',
-            'h5py (>=2.7.1)',
+            'h5py (>=2.9)',
             'tqdm']
 
 EXTRAS_REQUIRE = {'graphics': ['matplotlib-label-lines (>=0.3.6)'],
-                  'explorer': ['ipywidgets (>=7.5)']}
+                  'explorer': ['ipywidgets (>=7.5)'],
+                  'compression': ['hdf5plugin'],
+                  'kernels': ['numba (>=0.45)']}
 INSTALL_REQUIRES = ['cython (>=0.28.5)',
                     'numpy (>=1.14.2)',
                     'scipy (>=1.1.0)',
                     'matplotlib (>=3.0.0)',
                     'qutip (>=4.3.1)',
-                    'h5py (>=2.7.1)',
+                    'h5py (>=2.9)',
                     'tqdm']
 PACKAGES = ['scqubits', 'scqubits/core', 'scqubits/tests', 'scqubits/utils']
 PYTHON_VERSION = '>=3.5'